@@ -7,225 +7,634 @@ and removes them after user confirmation.
 """
 
 import argparse
+import json
 import os
+import queue
+import re
 import shutil
+import stat
 import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 
 import pathspec
 
+# Worker threads for I/O-bound scanning; os.scandir releases the GIL
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-def load_gitignore_patterns(directory: Path) -> Optional[pathspec.PathSpec]:
+# unlinkat() lets files be removed relative to an open parent directory
+_UNLINK_SUPPORTS_DIR_FD = os.unlink in os.supports_dir_fd
+
+# Named groups inside pathspec's pattern regexes would collide once combined
+_NAMED_GROUP = re.compile(r"\(\?P<[^>]+>")
+
+
+class GitignoreMatcher:
+    """
+    Match paths against the patterns of a single .gitignore.
+
+    All pattern regexes are fused into one alternation, ordered from the last
+    pattern to the first, so a single regex match finds the last matching
+    pattern, which decides whether the path is ignored.
+    """
+
+    __slots__ = ("runs", "regex", "own_regex", "includes", "has_negation")
+
+    def __init__(self, runs: list[tuple[bool, list[str]]]) -> None:
+        """
+        Create a matcher from runs of pattern regexes.
+
+        Args:
+            runs: (include, regex sources) pairs, ordered from the last pattern
+                to the first; consecutive patterns with the same include flag
+                share one run
+        """
+        self.runs = runs
+        alternatives = [
+            f"(?P<g{index}>{'|'.join(f'(?:{regex})' for regex in regexes)})"
+            for index, (_, regexes) in enumerate(runs)
+        ]
+        self.regex = re.compile("|".join(alternatives)) if runs else None
+        # Pattern regexes also match every path below a matching directory;
+        # this variant only matches when a pattern covers the whole path
+        self.own_regex = (
+            re.compile("|".join(f"{alternative}\\Z" for alternative in alternatives))
+            if runs else None
+        )
+        self.includes = {f"g{index}": include for index, (include, _) in enumerate(runs)}
+        # Without negations any match ignores the path
+        self.has_negation = not all(self.includes.values())
+
+    @classmethod
+    def from_spec(cls, spec: pathspec.PathSpec) -> "GitignoreMatcher":
+        """
+        Build the combined regex from a compiled PathSpec.
+
+        Args:
+            spec: The PathSpec loaded from a .gitignore
+
+        Returns:
+            GitignoreMatcher for the spec's patterns
+        """
+        runs: list[tuple[bool, list[str]]] = []
+        for pattern in reversed(spec.patterns):
+            if pattern.include is None or pattern.regex is None:
+                continue
+            regex = _NAMED_GROUP.sub("(?:", pattern.regex.pattern)
+            if not regex.startswith("^"):
+                # pathspec applies pattern regexes with search(), so unanchored
+                # ones (e.g. from "*/") may match anywhere in the path
+                regex = f"^(?s:.*?)(?:{regex})"
+            if runs and runs[-1][0] == pattern.include:
+                runs[-1][1].append(regex)
+            else:
+                runs.append((pattern.include, [regex]))
+        return cls(runs)
+
+    def check_files(self, files: Iterable[str]) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the paths that some pattern matches, with their decision.
+
+        Args:
+            files: Paths relative to the .gitignore's directory
+
+        Returns:
+            Iterator over (path, ignored) pairs; ignored is False when a
+            negated pattern re-includes the path
+        """
+        if self.regex is None or self.own_regex is None:
+            return iter(())
+        # Bind lookups once for the whole batch
+        match = self.regex.match
+        if not self.has_negation:
+            return ((file, True) for file in files if match(file) is not None)
+        return self._check_negated_files(files, match, self.own_regex.match)
+
+    def _check_negated_files(
+        self,
+        files: Iterable[str],
+        match: Callable[[str], re.Match[str] | None],
+        own_match: Callable[[str], re.Match[str] | None]
+    ) -> Iterator[tuple[str, bool]]:
+        """
+        Yield the decided paths for a .gitignore with negated patterns.
+
+        A negated pattern that only matches a parent directory of a path
+        re-includes that directory, not the path itself, so the path is
+        decided by the patterns matching it directly, if any.
+
+        Args:
+            files: Paths relative to the .gitignore's directory
+            match: The combined regex's match method
+            own_match: The whole-path regex's match method
+
+        Returns:
+            Iterator over (path, ignored) pairs
+        """
+        includes = self.includes
+        for file in files:
+            result = match(file)
+            if result is None:
+                continue
+            if not includes[result.lastgroup or ""]:
+                result = own_match(file)
+                if result is None:
+                    continue
+            yield file, includes[result.lastgroup or ""]
+
+
+# Compiled matchers keyed by .gitignore path, stored with the (mtime_ns, size)
+# they were compiled from; holds the .gitignore files seen by this process
+_spec_cache: dict[str, tuple[tuple[int, int], GitignoreMatcher]] = {}
+
+# Matcher runs loaded from the persistent cache with the signature they were
+# compiled from, compiled only when their .gitignore is encountered
+_persisted_specs: dict[str, tuple[tuple[int, int], list[tuple[bool, list[str]]]]] = {}
+
+_SPEC_CACHE_VERSION = 3
+
+# Entries kept in the persistent cache; the least recently written are dropped
+_SPEC_CACHE_MAX_ENTRIES = 1000
+
+# (length of the spec directory path plus separator, matcher), nearest first
+ActiveSpecs = tuple[tuple[int, GitignoreMatcher], ...]
+
+
+class IgnoredItem(NamedTuple):
+    """An ignored file or directory found by find_ignored_files."""
+
+    path: str
+    relative_path: str
+
+
+def load_gitignore_patterns(
+    directory: str | os.PathLike[str]
+) -> Optional[GitignoreMatcher]:
     """
     Load .gitignore patterns from a directory.
 
+    Compiled matchers are cached, in memory and in the persistent cache
+    loaded by load_spec_cache, and reused while the .gitignore's
+    modification time and size are unchanged.
+
     Args:
         directory: The directory to load .gitignore from
 
     Returns:
-        PathSpec object if .gitignore exists, None otherwise
+        GitignoreMatcher object if .gitignore exists, None otherwise
     """
-    gitignore_path = directory / ".gitignore"
-    if not gitignore_path.exists():
+    gitignore_path = os.path.join(directory, ".gitignore")
+    try:
+        stat_result = os.stat(gitignore_path)
+    except FileNotFoundError:
         return None
 
-    with open(gitignore_path, "r", encoding="utf-8") as gitignore_file:
-        lines = gitignore_file.readlines()
+    cache_key = gitignore_path
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _spec_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    spec = None
+    persisted = _persisted_specs.get(cache_key)
+    if persisted is not None and persisted[0] == signature:
+        try:
+            spec = GitignoreMatcher(persisted[1])
+        except re.error:
+            spec = None
 
-    return pathspec.PathSpec.from_lines("gitwildmatch", lines)
+    if spec is None:
+        with open(gitignore_path, "r", encoding="utf-8") as gitignore_file:
+            lines = gitignore_file.readlines()
+        spec = GitignoreMatcher.from_spec(pathspec.PathSpec.from_lines("gitwildmatch", lines))
 
+    _spec_cache[cache_key] = (signature, spec)
+    return spec
 
-def collect_all_gitignore_specs(root_directory: Path) -> dict[Path, pathspec.PathSpec]:
-    """
-    Collect all .gitignore files from the root directory and its subdirectories.
 
-    Args:
-        root_directory: The root directory to start scanning from
+def get_spec_cache_path() -> Path:
+    """
+    Get the location of the persistent spec cache.
 
     Returns:
-        Dictionary mapping directory paths to their PathSpec objects
+        Path of the cache file under $XDG_CACHE_HOME (default: ~/.cache)
     """
-    gitignore_specs: dict[Path, pathspec.PathSpec] = {}
-
-    for current_dir, _, _ in os.walk(root_directory):
-        current_path = Path(current_dir)
-        spec = load_gitignore_patterns(current_path)
-        if spec is not None:
-            gitignore_specs[current_path] = spec
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "gi_cleaner" / "specs.json"
 
-    return gitignore_specs
 
+def load_spec_cache() -> None:
+    """
+    Load compiled .gitignore matchers from the persistent cache.
 
-def is_file_ignored(
-    file_path: Path,
-    root_directory: Path,
-    gitignore_specs: dict[Path, pathspec.PathSpec]
-) -> bool:
+    A missing, unreadable or malformed cache file, or one written by another
+    cache format or pathspec version, is ignored, as are malformed entries.
     """
-    Check if a file is ignored by any applicable .gitignore.
+    try:
+        with open(get_spec_cache_path(), encoding="utf-8") as cache_file:
+            cache_data = json.load(cache_file)
+    except (OSError, ValueError):
+        return
 
-    This follows Git's behavior where .gitignore files apply to their
-    directory and all subdirectories.
+    if (
+        not isinstance(cache_data, dict)
+        or cache_data.get("version") != _SPEC_CACHE_VERSION
+        or cache_data.get("pathspec_version") != pathspec.__version__
+        or not isinstance(cache_data.get("specs"), dict)
+    ):
+        return
 
-    Args:
-        file_path: The file path to check
-        root_directory: The root directory of the project
-        gitignore_specs: Dictionary of .gitignore specs by directory
+    for cache_key, entry in cache_data["specs"].items():
+        if _is_valid_cache_entry(entry):
+            _persisted_specs[cache_key] = (
+                (entry["mtime_ns"], entry["size"]),
+                [(include, regexes) for include, regexes in entry["runs"]],
+            )
 
-    Returns:
-        True if the file is ignored, False otherwise
-    """
-    relative_to_root = file_path.relative_to(root_directory)
-
-    # Check each .gitignore from root to the file's parent directory
-    current_check_dir = root_directory
-    for part in relative_to_root.parent.parts:
-        if current_check_dir in gitignore_specs:
-            spec = gitignore_specs[current_check_dir]
-            relative_path = file_path.relative_to(current_check_dir)
-            if spec.match_file(str(relative_path)):
-                return True
-        current_check_dir = current_check_dir / part
-
-    # Check the final directory
-    if current_check_dir in gitignore_specs:
-        spec = gitignore_specs[current_check_dir]
-        relative_path = file_path.relative_to(current_check_dir)
-        if spec.match_file(str(relative_path)):
-            return True
 
-    # Also check the file's own directory
-    file_parent = file_path.parent
-    if file_parent in gitignore_specs:
-        spec = gitignore_specs[file_parent]
-        if spec.match_file(file_path.name):
-            return True
+def _is_valid_cache_entry(entry: object) -> bool:
+    """
+    Check the shape of a persistent cache entry.
 
-    return False
+    Args:
+        entry: The entry loaded from the cache file
 
+    Returns:
+        True if entry holds an integer mtime_ns and size, and runs of
+        [include, [regex, ...]] pairs
+    """
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("mtime_ns"), int)
+        and isinstance(entry.get("size"), int)
+        and isinstance(entry.get("runs"), list)
+        and all(
+            isinstance(run, list)
+            and len(run) == 2
+            and isinstance(run[0], bool)
+            and isinstance(run[1], list)
+            and all(isinstance(regex, str) for regex in run[1])
+            for run in entry["runs"]
+        )
+    )
 
-def is_directory_ignored(
-    dir_path: Path,
-    root_directory: Path,
-    gitignore_specs: dict[Path, pathspec.PathSpec]
-) -> bool:
+
+def save_spec_cache(root_directory: str | os.PathLike[str]) -> None:
     """
-    Check if a directory is ignored by any applicable .gitignore.
+    Save the compiled .gitignore matchers to the persistent cache.
 
-    Args:
-        dir_path: The directory path to check
-        root_directory: The root directory of the project
-        gitignore_specs: Dictionary of .gitignore specs by directory
+    Entries for .gitignore files below root_directory that were not seen in
+    this run are dropped. Empty .gitignore files are not cached. The file is
+    only rewritten when its entries change.
 
-    Returns:
-        True if the directory is ignored, False otherwise
+    Args:
+        root_directory: The root directory that was scanned
     """
-    relative_to_root = dir_path.relative_to(root_directory)
+    root_prefix = os.path.join(os.fspath(root_directory), "")
+    specs = {
+        cache_key: entry
+        for cache_key, entry in _persisted_specs.items()
+        if not cache_key.startswith(root_prefix) and cache_key not in _spec_cache
+    }
+    for cache_key, (signature, spec) in _spec_cache.items():
+        if signature[1] != 0:
+            specs[cache_key] = (signature, spec.runs)
+    if specs == _persisted_specs:
+        return
 
-    # Check each .gitignore from root to the directory's parent
-    current_check_dir = root_directory
-    for part in relative_to_root.parts:
-        if current_check_dir in gitignore_specs:
-            spec = gitignore_specs[current_check_dir]
-            # For directories, we need to check with trailing slash
-            relative_path = dir_path.relative_to(current_check_dir)
-            dir_pattern = str(relative_path) + "/"
-            if spec.match_file(dir_pattern) or spec.match_file(str(relative_path)):
-                return True
-        current_check_dir = current_check_dir / part
+    # Entries from this run were added last, so the oldest are dropped first
+    cache_keys = list(specs)[-_SPEC_CACHE_MAX_ENTRIES:]
+    cache_path = get_spec_cache_path()
+    temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_path, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    "version": _SPEC_CACHE_VERSION,
+                    "pathspec_version": pathspec.__version__,
+                    "specs": {
+                        cache_key: {
+                            "mtime_ns": specs[cache_key][0][0],
+                            "size": specs[cache_key][0][1],
+                            "runs": specs[cache_key][1],
+                        }
+                        for cache_key in cache_keys
+                    },
+                },
+                cache_file
+            )
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        temporary_path.unlink(missing_ok=True)
+
+
+def _match_batch(
+    paths: list[str],
+    is_dir: bool,
+    active_specs: ActiveSpecs
+) -> set[str]:
+    """
+    Match the entries of one directory against the active .gitignore specs.
 
-    return False
+    Each spec is called once for the whole batch, nearest .gitignore first.
+    As in git, the nearest .gitignore with a matching pattern decides: an
+    entry it re-includes with a negated pattern is kept.
 
+    Args:
+        paths: Absolute paths of the entries
+        is_dir: Whether the entries are directories
+        active_specs: Specs that apply to the entries, nearest first
 
-def find_ignored_files(root_directory: Path) -> tuple[list[Path], list[Path]]:
+    Returns:
+        Set of the ignored paths
     """
-    Find all files and directories that are ignored by .gitignore.
+    matched: set[str] = set()
+    pending = paths
+    for prefix_length, spec in active_specs:
+        if not pending:
+            break
+        candidates: dict[str, str] = {}
+        for path in pending:
+            relative_path = path[prefix_length:]
+            if os.sep != "/":
+                relative_path = relative_path.replace(os.sep, "/")
+            # A trailing slash marks directories, as git matches them
+            candidates[relative_path + "/" if is_dir else relative_path] = path
+        decided: set[str] = set()
+        for hit, ignored in spec.check_files(candidates):
+            path = candidates[hit]
+            decided.add(path)
+            if ignored:
+                matched.add(path)
+        pending = [path for path in pending if path not in decided]
+    return matched
+
+
+def _scan_directory(
+    current_dir: str,
+    active_specs: ActiveSpecs,
+    ignored_files: list[str],
+    ignored_directories: list[str]
+) -> tuple[list[str], ActiveSpecs]:
+    """
+    Record the ignored entries of a single directory.
 
     Args:
-        root_directory: The root directory to scan
+        current_dir: The directory to scan
+        active_specs: Specs inherited from the parent directories
+        ignored_files: List to append ignored file paths to
+        ignored_directories: List to append ignored directory paths to
 
     Returns:
-        Tuple of (ignored_files, ignored_directories)
+        Tuple of (subdirectories to descend into, specs active in them)
     """
-    gitignore_specs = collect_all_gitignore_specs(root_directory)
+    try:
+        with os.scandir(current_dir) as iterator:
+            entries = list(iterator)
+    except OSError:
+        return [], active_specs
+
+    directory_paths: list[str] = []
+    file_paths: list[str] = []
+    has_gitignore = False
+    for entry in entries:
+        # d_type tells us the kind without an extra stat call
+        if entry.is_dir(follow_symlinks=False):
+            # Skip .git directories at every level, as git does for nested
+            # repositories and submodules
+            if entry.name != ".git":
+                directory_paths.append(entry.path)
+        else:
+            if entry.name == ".gitignore":
+                has_gitignore = True
+            file_paths.append(entry.path)
+
+    spec = load_gitignore_patterns(current_dir) if has_gitignore else None
+    if spec is not None:
+        # Built once per .gitignore and shared by the whole subtree
+        active_specs = ((len(os.path.join(current_dir, "")), spec),) + active_specs
+
+    matched_directories = _match_batch(directory_paths, True, active_specs)
+    subdirectories: list[str] = []
+    for dir_path in directory_paths:
+        if dir_path in matched_directories:
+            ignored_directories.append(dir_path)
+        else:
+            subdirectories.append(dir_path)
 
-    if not gitignore_specs:
-        return [], []
+    matched_files = _match_batch(file_paths, False, active_specs)
+    ignored_files.extend(path for path in file_paths if path in matched_files)
 
-    ignored_files: list[Path] = []
-    ignored_directories: list[Path] = []
-    skip_directories: set[Path] = set()
+    return subdirectories, active_specs
 
-    for current_dir, directories, files in os.walk(root_directory):
-        current_path = Path(current_dir)
 
-        # Skip .git directory
-        if ".git" in directories:
-            directories.remove(".git")
+def _scan_subtree(
+    current_dir: str,
+    active_specs: ActiveSpecs,
+    report: Callable[[list[str], list[str]], None],
+    cancelled: threading.Event
+) -> None:
+    """
+    Find the ignored files and directories below a directory.
 
-        # Skip already marked ignored directories
-        if current_path in skip_directories:
-            directories.clear()
-            continue
+    Args:
+        current_dir: The root of the subtree
+        active_specs: Specs inherited from the parent directories
+        report: Called with (ignored_files, ignored_directories) for each
+            directory that has ignored entries
+        cancelled: Stops the scan before the next directory once set
+    """
+    def _descend(directory: str, specs: ActiveSpecs) -> None:
+        if cancelled.is_set():
+            return
+        ignored_files: list[str] = []
+        ignored_directories: list[str] = []
+        subdirectories, specs = _scan_directory(
+            directory, specs, ignored_files, ignored_directories
+        )
+        if ignored_files or ignored_directories:
+            report(ignored_files, ignored_directories)
+        for subdirectory in subdirectories:
+            _descend(subdirectory, specs)
+
+    _descend(current_dir, active_specs)
+
+
+def iter_ignored_items(
+    root_directory: str | os.PathLike[str]
+) -> Generator[tuple[str, IgnoredItem], None, None]:
+    """
+    Yield the files and directories that are ignored by .gitignore.
+
+    The tree is walked once with os.scandir, working on plain strings: each
+    directory's .gitignore is loaded on entry and prepended to the chain of
+    specs that apply to the directory, which is passed down to its
+    subdirectories. Ignored directories are pruned so their contents are
+    never scanned; as in git, a negated pattern cannot re-include a path
+    whose parent directory is excluded. The subtrees below the root are
+    scanned concurrently. Items of the first unfinished subtree are yielded
+    as soon as they are found; later subtrees are buffered until it is done,
+    so the order does not depend on thread scheduling. Closing the generator
+    stops the scan without waiting for the remaining subtrees.
+
+    Directories are yielded before their contents, and no yielded item lies
+    inside a yielded directory.
 
-        # Check directories
-        dirs_to_remove: list[str] = []
-        for dir_name in directories:
-            dir_path = current_path / dir_name
-            if is_directory_ignored(dir_path, root_directory, gitignore_specs):
-                ignored_directories.append(dir_path)
-                skip_directories.add(dir_path)
-                dirs_to_remove.append(dir_name)
+    Args:
+        root_directory: The root directory to scan
 
-        # Remove ignored directories from further traversal
-        for dir_name in dirs_to_remove:
-            directories.remove(dir_name)
+    Returns:
+        Generator of ("file" | "dir", item) pairs, each item holding the
+        absolute path and the path relative to root_directory
+    """
+    root_str = os.fspath(root_directory)
+    root_prefix_length = len(os.path.join(root_str, ""))
+
+    def _items(ignored_files: list[str], ignored_directories: list[str]) -> Iterator[
+        tuple[str, IgnoredItem]
+    ]:
+        for path in ignored_directories:
+            yield "dir", IgnoredItem(path, path[root_prefix_length:])
+        for path in ignored_files:
+            yield "file", IgnoredItem(path, path[root_prefix_length:])
+
+    ignored_files: list[str] = []
+    ignored_directories: list[str] = []
+    subdirectories, active_specs = _scan_directory(
+        root_str, (), ignored_files, ignored_directories
+    )
+    yield from _items(ignored_files, ignored_directories)
+
+    # (subtree index, per-directory result) from the workers; a None result
+    # marks a finished subtree
+    results: queue.Queue[tuple[int, tuple[list[str], list[str]] | None]] = queue.Queue()
+
+    def _reporter(index: int) -> Callable[[list[str], list[str]], None]:
+        return lambda files, directories: results.put((index, (files, directories)))
+
+    def _on_done(index: int) -> Callable[[Future[None]], None]:
+        return lambda _: results.put((index, None))
+
+    # Closing the iterator early stops the workers instead of waiting for them
+    cancelled = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+    try:
+        futures = [
+            executor.submit(
+                _scan_subtree, subdirectory, active_specs, _reporter(index), cancelled
+            )
+            for index, subdirectory in enumerate(subdirectories)
+        ]
+        for index, future in enumerate(futures):
+            future.add_done_callback(_on_done(index))
+
+        buffered: list[list[tuple[list[str], list[str]]]] = [[] for _ in futures]
+        finished = [False] * len(futures)
+        current = 0
+        while current < len(futures):
+            index, result = results.get()
+            if result is not None:
+                if index == current:
+                    yield from _items(*result)
+                else:
+                    buffered[index].append(result)
+                continue
+
+            finished[index] = True
+            # Move past finished subtrees, releasing what the next one buffered
+            while current < len(futures) and finished[current]:
+                current += 1
+                if current < len(futures):
+                    for buffered_result in buffered[current]:
+                        yield from _items(*buffered_result)
+                    buffered[current].clear()
+
+        # Re-raise any error from the workers
+        for future in futures:
+            future.result()
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def find_ignored_files(
+    root_directory: str | os.PathLike[str]
+) -> tuple[list[IgnoredItem], list[IgnoredItem]]:
+    """
+    Find all files and directories that are ignored by .gitignore.
 
-        # Check files
-        for file_name in files:
-            file_path = current_path / file_name
-            if is_file_ignored(file_path, root_directory, gitignore_specs):
-                ignored_files.append(file_path)
+    Args:
+        root_directory: The root directory to scan
 
+    Returns:
+        Tuple of (ignored_files, ignored_directories), each item holding the
+        absolute path and the path relative to root_directory
+    """
+    ignored_files: list[IgnoredItem] = []
+    ignored_directories: list[IgnoredItem] = []
+    for kind, item in iter_ignored_items(root_directory):
+        (ignored_directories if kind == "dir" else ignored_files).append(item)
     return ignored_files, ignored_directories
 
 
 def display_ignored_items(
-    ignored_files: list[Path],
-    ignored_directories: list[Path],
-    root_directory: Path
-) -> None:
+    items: Iterable[tuple[str, IgnoredItem]]
+) -> tuple[list[IgnoredItem], list[IgnoredItem]]:
     """
     Display the list of ignored files and directories.
 
+    While items are consumed, a running count is shown on a terminal; the
+    sorted list is printed once the scan is complete.
+
     Args:
-        ignored_files: List of ignored file paths
-        ignored_directories: List of ignored directory paths
-        root_directory: The root directory for relative path display
+        items: ("file" | "dir", item) pairs, as yielded by iter_ignored_items
+
+    Returns:
+        Tuple of (ignored_files, ignored_directories)
     """
+    ignored_files: list[IgnoredItem] = []
+    ignored_directories: list[IgnoredItem] = []
+    show_progress = sys.stdout.isatty()
+
+    for kind, item in items:
+        (ignored_directories if kind == "dir" else ignored_files).append(item)
+        if show_progress:
+            found_items = len(ignored_files) + len(ignored_directories)
+            print(f"\r  {found_items} ignored item(s) found...", end="", flush=True)
+
     total_items = len(ignored_files) + len(ignored_directories)
 
+    if show_progress and total_items:
+        print()
+
     if total_items == 0:
         print("No ignored files or directories found.")
-        return
+        return ignored_files, ignored_directories
 
     print(f"\nFound {total_items} ignored item(s):\n")
 
     if ignored_directories:
         print("Directories:")
-        for dir_path in sorted(ignored_directories):
-            relative_path = dir_path.relative_to(root_directory)
+        for relative_path in sorted(item.relative_path for item in ignored_directories):
             print(f"  [DIR]  {relative_path}/")
 
     if ignored_files:
         print("\nFiles:")
-        for file_path in sorted(ignored_files):
-            relative_path = file_path.relative_to(root_directory)
+        for relative_path in sorted(item.relative_path for item in ignored_files):
             print(f"  [FILE] {relative_path}")
 
     print()
 
+    return ignored_files, ignored_directories
+
 
 def confirm_deletion() -> bool:
     """
@@ -244,19 +653,141 @@ def confirm_deletion() -> bool:
             print("Please enter 'yes' or 'no'.")
 
 
+def _iter_ancestors(relative_path: str) -> Iterator[str]:
+    """
+    Yield the ancestor directories of a relative path, nearest first.
+
+    Args:
+        relative_path: A path relative to the root directory
+
+    Returns:
+        Iterator over the relative paths of the ancestors
+    """
+    ancestor = relative_path
+    while (separator_index := ancestor.rfind(os.sep)) != -1:
+        ancestor = ancestor[:separator_index]
+        yield ancestor
+
+
+def _unlink_files(
+    directory: str,
+    items: list[IgnoredItem],
+    dry_run: bool
+) -> list[OSError | None]:
+    """
+    Delete files that share a parent directory.
+
+    The directory is opened once and its files are unlinked relative to that
+    descriptor where the platform supports it.
+
+    Args:
+        directory: The common parent directory
+        items: The files to delete
+        dry_run: If True, only simulate deletion
+
+    Returns:
+        The error raised for each file, or None if it was deleted
+    """
+    results: list[OSError | None] = []
+    directory_fd: int | None = None
+    if not dry_run and _UNLINK_SUPPORTS_DIR_FD:
+        try:
+            directory_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            directory_fd = None
+
+    try:
+        for item in items:
+            try:
+                if not dry_run:
+                    if directory_fd is not None:
+                        os.unlink(os.path.basename(item.path), dir_fd=directory_fd)
+                    else:
+                        os.unlink(item.path)
+                results.append(None)
+            except OSError as error:
+                results.append(error)
+    finally:
+        if directory_fd is not None:
+            os.close(directory_fd)
+
+    return results
+
+
+def _remove_directory(dir_path: str, dry_run: bool) -> OSError | None:
+    """
+    Delete a directory tree.
+
+    Args:
+        dir_path: The directory to delete
+        dry_run: If True, only simulate deletion
+
+    Returns:
+        The error raised, or None if the directory was deleted
+    """
+    try:
+        if not dry_run:
+            shutil.rmtree(dir_path)
+    except OSError as error:
+        return error
+    return None
+
+
+def _report_deleted_files(items: list[IgnoredItem], errors: list[OSError | None]) -> int:
+    """
+    Print the outcome of deleting files.
+
+    Args:
+        items: The files that were deleted
+        errors: The error for each file, or None if it was deleted
+
+    Returns:
+        Number of deleted files
+    """
+    deleted_files = 0
+    for item, error in zip(items, errors, strict=True):
+        if error is None:
+            print(f"Deleted file: {item.relative_path}")
+            deleted_files += 1
+        else:
+            print(f"Error deleting {item.relative_path}: {error}", file=sys.stderr)
+    return deleted_files
+
+
+def _report_deleted_directory(item: IgnoredItem, error: OSError | None) -> int:
+    """
+    Print the outcome of deleting a directory.
+
+    Args:
+        item: The directory that was deleted
+        error: The error raised, or None if it was deleted
+
+    Returns:
+        1 if the directory was deleted, 0 otherwise
+    """
+    if error is not None:
+        print(f"Error deleting {item.relative_path}/: {error}", file=sys.stderr)
+        return 0
+    print(f"Deleted directory: {item.relative_path}/")
+    return 1
+
+
 def delete_items(
-    ignored_files: list[Path],
-    ignored_directories: list[Path],
-    root_directory: Path,
+    ignored_files: list[IgnoredItem],
+    ignored_directories: list[IgnoredItem],
     dry_run: bool = False
 ) -> tuple[int, int]:
     """
     Delete the ignored files and directories.
 
+    Removals run on a thread pool so that several syscalls are in flight at
+    once; results are reported in order from the calling thread. Files
+    inside one of the ignored directories are left to be removed with it.
+
     Args:
         ignored_files: List of files to delete
-        ignored_directories: List of directories to delete
-        root_directory: The root directory for relative path display
+        ignored_directories: List of directories to delete, parents listed
+            before their subdirectories as returned by find_ignored_files
         dry_run: If True, only simulate deletion
 
     Returns:
@@ -265,37 +796,124 @@ def delete_items(
     deleted_files = 0
     deleted_directories = 0
 
-    # Delete files first
-    for file_path in ignored_files:
-        relative_path = file_path.relative_to(root_directory)
-        try:
-            if not dry_run:
-                file_path.unlink()
-            print(f"Deleted file: {relative_path}")
-            deleted_files += 1
-        except OSError as error:
-            print(f"Error deleting {relative_path}: {error}", file=sys.stderr)
-
-    # Delete directories (sorted by depth, deepest first)
-    sorted_directories = sorted(
-        ignored_directories,
-        key=lambda p: len(p.parts),
-        reverse=True
-    )
+    # Delete files first, one task per parent directory
+    files_by_directory: dict[str, list[IgnoredItem]] = {}
+    for item in ignored_files:
+        files_by_directory.setdefault(os.path.dirname(item.path), []).append(item)
 
-    for dir_path in sorted_directories:
-        relative_path = dir_path.relative_to(root_directory)
-        try:
-            if not dry_run:
-                shutil.rmtree(dir_path)
-            print(f"Deleted directory: {relative_path}/")
-            deleted_directories += 1
-        except OSError as error:
-            print(f"Error deleting {relative_path}/: {error}", file=sys.stderr)
+    if ignored_directories:
+        ignored_directory_paths = {item.relative_path for item in ignored_directories}
+        files_by_directory = {
+            directory: items
+            for directory, items in files_by_directory.items()
+            if ignored_directory_paths.isdisjoint(_iter_ancestors(items[0].relative_path))
+        }
+
+    # Delete directories in reverse discovery order, which removes nested
+    # directories before their parents. Directories are removed concurrently
+    # in waves; a new wave starts only when a directory contains one that is
+    # already in the current wave.
+    directory_waves: list[list[IgnoredItem]] = [[]]
+    wave_ancestors: set[str] = set()
+    for item in reversed(ignored_directories):
+        if item.relative_path in wave_ancestors:
+            directory_waves.append([])
+            wave_ancestors = set()
+        directory_waves[-1].append(item)
+        wave_ancestors.update(_iter_ancestors(item.relative_path))
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        file_results = executor.map(
+            lambda group: _unlink_files(group[0], group[1], dry_run),
+            files_by_directory.items()
+        )
+        for items, errors in zip(files_by_directory.values(), file_results, strict=True):
+            deleted_files += _report_deleted_files(items, errors)
+
+        for items in directory_waves:
+            dir_results = executor.map(
+                lambda item: _remove_directory(item.path, dry_run),
+                items
+            )
+            for item, error in zip(items, dir_results, strict=True):
+                deleted_directories += _report_deleted_directory(item, error)
 
     return deleted_files, deleted_directories
 
 
+def delete_items_as_found(items: Iterable[tuple[str, IgnoredItem]]) -> tuple[int, int, int]:
+    """
+    Delete ignored files and directories while they are still being found.
+
+    Each item is listed and handed to a thread pool as soon as it arrives,
+    so removal overlaps with scanning. This relies on iter_ignored_items
+    never yielding an item inside a yielded directory. Results are reported
+    in discovery order as soon as they are available.
+
+    Args:
+        items: ("file" | "dir", item) pairs, as yielded by iter_ignored_items
+
+    Returns:
+        Tuple of (found_items_count, deleted_files_count,
+        deleted_directories_count)
+    """
+    found_items = 0
+    deleted_files = 0
+    deleted_directories = 0
+
+    # Submitted removals in discovery order, each with the function printing
+    # its outcome and returning the number of removed files or directories
+    tasks: deque[tuple[str, Future[Any], Callable[[Any], int]]] = deque()
+
+    def _report_finished(wait: bool) -> None:
+        nonlocal deleted_files, deleted_directories
+        while tasks and (wait or tasks[0][1].done()):
+            kind, future, report = tasks.popleft()
+            if kind == "dir":
+                deleted_directories += report(future.result())
+            else:
+                deleted_files += report(future.result())
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        # Consecutive files from the same directory share one task
+        file_batch: list[IgnoredItem] = []
+        batch_directory = ""
+
+        def _submit_file_batch() -> None:
+            if file_batch:
+                batch = file_batch.copy()
+                for item in batch:
+                    print(f"  [FILE] {item.relative_path}")
+                tasks.append((
+                    "file",
+                    executor.submit(_unlink_files, batch_directory, batch, False),
+                    partial(_report_deleted_files, batch),
+                ))
+                file_batch.clear()
+
+        for kind, item in items:
+            found_items += 1
+            if kind == "dir":
+                _submit_file_batch()
+                print(f"  [DIR]  {item.relative_path}/")
+                tasks.append((
+                    "dir",
+                    executor.submit(_remove_directory, item.path, False),
+                    partial(_report_deleted_directory, item),
+                ))
+            else:
+                directory = os.path.dirname(item.path)
+                if directory != batch_directory:
+                    _submit_file_batch()
+                    batch_directory = directory
+                file_batch.append(item)
+            _report_finished(wait=False)
+        _submit_file_batch()
+        _report_finished(wait=True)
+
+    return found_items, deleted_files, deleted_directories
+
+
 def main() -> int:
     """
     Main entry point for gi_cleaner.
@@ -331,26 +949,46 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    root_directory = Path(args.directory).resolve()
+    root_directory = os.path.abspath(args.directory)
 
-    if not root_directory.exists():
+    try:
+        root_stat = os.stat(root_directory)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"Error: Directory '{root_directory}' does not exist.", file=sys.stderr)
         return 1
+    except OSError as error:
+        print(f"Error: Cannot access '{root_directory}': {error}", file=sys.stderr)
+        return 1
 
-    if not root_directory.is_dir():
+    if not stat.S_ISDIR(root_stat.st_mode):
         print(f"Error: '{root_directory}' is not a directory.", file=sys.stderr)
         return 1
 
     # Check if .gitignore exists in root
-    if not (root_directory / ".gitignore").exists():
+    if not os.path.exists(os.path.join(root_directory, ".gitignore")):
         print(f"Error: No .gitignore found in '{root_directory}'.", file=sys.stderr)
         return 1
 
     print(f"Scanning directory: {root_directory}")
 
-    ignored_files, ignored_directories = find_ignored_files(root_directory)
+    load_spec_cache()
+
+    if args.yes and not args.dry_run:
+        # Nothing to confirm, so delete items while the scan is running
+        found_items, deleted_files, deleted_dirs = delete_items_as_found(
+            iter_ignored_items(root_directory)
+        )
+        save_spec_cache(root_directory)
+        if not found_items:
+            print("No ignored files or directories found.")
+            return 0
+        print(f"\nDeleted {deleted_files} file(s) and {deleted_dirs} directory(ies).")
+        return 0
 
-    display_ignored_items(ignored_files, ignored_directories, root_directory)
+    ignored_files, ignored_directories = display_ignored_items(
+        iter_ignored_items(root_directory)
+    )
+    save_spec_cache(root_directory)
 
     if not ignored_files and not ignored_directories:
         return 0
@@ -359,16 +997,11 @@ def main() -> int:
         print("Dry run mode - no files were deleted.")
         return 0
 
-    if not args.yes:
-        if not confirm_deletion():
-            print("Deletion cancelled.")
-            return 0
+    if not args.yes and not confirm_deletion():
+        print("Deletion cancelled.")
+        return 0
 
-    deleted_files, deleted_dirs = delete_items(
-        ignored_files,
-        ignored_directories,
-        root_directory
-    )
+    deleted_files, deleted_dirs = delete_items(ignored_files, ignored_directories)
 
     print(f"\nDeleted {deleted_files} file(s) and {deleted_dirs} directory(ies).")
 
@@ -0,0 +1,458 @@
+"""Tests for gi_cleaner.main"""
+
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pathspec
+import pytest
+
+import gi_cleaner.main
+from gi_cleaner.main import (
+    _SPEC_CACHE_VERSION,
+    GitignoreMatcher,
+    IgnoredItem,
+    _unlink_files,
+    delete_items,
+    delete_items_as_found,
+    display_ignored_items,
+    find_ignored_files,
+    get_spec_cache_path,
+    iter_ignored_items,
+    load_spec_cache,
+    main,
+    save_spec_cache,
+)
+
+PATTERNS = [
+    "*", "*/", "**/", "!*/", "!*.py", "*.log", "!keep.log", "build/", "build",
+    "/local.txt", "a/**/b", "**/tmp", "doc/*.txt", "doc/**", "foo?", "[ab]*.c",
+    "!/build/", "x/", "!x/y", "x/*", "\\#hash", "# comment", "", "*.md", "!*.md",
+]
+
+PATHS = [
+    "a", "a/", "src/", "src/a.py", "a.py", "keep.log", "x.log", "d/keep.log",
+    "build", "build/", "d/build/", "local.txt", "d/local.txt", "a/b", "a/q/r/b",
+    "tmp/", "z/tmp", "doc/a.txt", "doc/q/a.txt", "doc/q/", "#hash", "foo1",
+    "a.c", "c.c", "x/", "x/y", "x/y/", "x/z", "r.md", "d/r.md/",
+]
+
+
+def _assert_same_as_pathspec(lines: list[str]) -> None:
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
+    decisions = dict(GitignoreMatcher.from_spec(spec).check_files(PATHS))
+    for path in PATHS:
+        expected = spec.check_file(path).include
+        if expected is False and "/" in path.rstrip("/"):
+            # A negation matching only a parent directory doesn't decide the path
+            continue
+        assert decisions.get(path) == expected, (lines, path)
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_matcher_single_pattern_matches_pathspec(pattern: str) -> None:
+    _assert_same_as_pathspec([pattern])
+
+
+def test_matcher_pattern_combinations_match_pathspec() -> None:
+    generator = random.Random(0)
+    for _ in range(2000):
+        _assert_same_as_pathspec(generator.sample(PATTERNS, generator.randint(0, 8)))
+
+
+def test_matcher_keeps_whitelisted_directories() -> None:
+    matcher = GitignoreMatcher.from_spec(
+        pathspec.PathSpec.from_lines("gitwildmatch", ["*", "!*/", "!*.py"])
+    )
+    assert dict(matcher.check_files(["src/", "src/a.py", "a.txt", "src/a.txt"])) == {
+        "src/": False, "src/a.py": False, "a.txt": True, "src/a.txt": True
+    }
+
+
+def test_matcher_negated_directory_skips_descendants() -> None:
+    matcher = GitignoreMatcher.from_spec(
+        pathspec.PathSpec.from_lines("gitwildmatch", ["!logs/", "!build"])
+    )
+    assert dict(matcher.check_files(["logs/", "logs/x.log", "build", "build/tmp"])) == {
+        "logs/": False, "build": False
+    }
+
+
+def _write_tree(root: Path, files: dict[str, str]) -> None:
+    for relative_path, content in files.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _relative_paths(items: list[IgnoredItem]) -> set[str]:
+    return {item.relative_path.replace(os.sep, "/") for item in items}
+
+
+def test_find_ignored_files_nearest_gitignore_wins(tmp_path: Path) -> None:
+    _write_tree(tmp_path, {
+        ".gitignore": "*.log\n",
+        "a.log": "",
+        "sub/.gitignore": "!keep.log\n",
+        "sub/keep.log": "",
+        "sub/other.log": "",
+    })
+
+    ignored_files, ignored_directories = find_ignored_files(tmp_path)
+
+    assert _relative_paths(ignored_files) == {"a.log", "sub/other.log"}
+    assert ignored_directories == []
+
+
+@pytest.mark.parametrize(("files", "expected"), [
+    (
+        {".gitignore": "*.log\n", "sub/.gitignore": "!logs/\n", "sub/logs/x.log": ""},
+        {"sub/logs/x.log"},
+    ),
+    (
+        {".gitignore": "**/tmp\n", "d/.gitignore": "!build\n", "d/build/tmp": ""},
+        {"d/build/tmp"},
+    ),
+    (
+        {".gitignore": "*.log\n", "sub/.gitignore": "!logs/\n!*.log\n", "sub/logs/x.log": ""},
+        set(),
+    ),
+])
+def test_find_ignored_files_negated_directory_defers_descendants(
+    tmp_path: Path,
+    files: dict[str, str],
+    expected: set[str]
+) -> None:
+    _write_tree(tmp_path, files)
+
+    ignored_files, ignored_directories = find_ignored_files(tmp_path)
+
+    assert _relative_paths(ignored_files) == expected
+    assert ignored_directories == []
+
+
+def test_find_ignored_files_prunes_ignored_directories(tmp_path: Path) -> None:
+    _write_tree(tmp_path, {
+        ".gitignore": "build/\n*.pyc\n",
+        "build/out.o": "",
+        "src/m.py": "",
+        "src/m.pyc": "",
+        ".git/HEAD": "",
+    })
+
+    ignored_files, ignored_directories = find_ignored_files(tmp_path)
+
+    assert _relative_paths(ignored_files) == {"src/m.pyc"}
+    assert _relative_paths(ignored_directories) == {"build"}
+
+
+@pytest.mark.parametrize("target", ["missing", "file.txt/sub", "loop"])
+def test_main_reports_inaccessible_directory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    target: str
+) -> None:
+    (tmp_path / "file.txt").write_text("")
+    (tmp_path / "loop").symlink_to(tmp_path / "loop")
+    monkeypatch.setattr(sys, "argv", ["gi_cleaner", "-d", str(tmp_path / target)])
+
+    assert main() == 1
+    assert capsys.readouterr().err.startswith("Error:")
+
+
+def test_main_yes_reports_nothing_found(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    project = tmp_path / "project"
+    _write_tree(project, {".gitignore": "*.log\n", "a.txt": ""})
+    monkeypatch.setattr(sys, "argv", ["gi_cleaner", "-y", "-d", str(project)])
+
+    assert main() == 0
+    assert capsys.readouterr().out.endswith("No ignored files or directories found.\n")
+
+
+@pytest.mark.parametrize("cache_data", [
+    {"version": _SPEC_CACHE_VERSION},
+    {"version": _SPEC_CACHE_VERSION, "pathspec_version": pathspec.__version__, "specs": []},
+    {"version": _SPEC_CACHE_VERSION, "pathspec_version": "0", "specs": {}},
+    {
+        "version": _SPEC_CACHE_VERSION,
+        "pathspec_version": pathspec.__version__,
+        "specs": {"x": ["bad"], "y": {"mtime_ns": 1, "size": 1, "runs": [[True, "a"]]}},
+    },
+    ["not", "a", "dict"],
+])
+def test_load_spec_cache_discards_malformed_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    cache_data: object
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(gi_cleaner.main, "_persisted_specs", {})
+    cache_path = get_spec_cache_path()
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(json.dumps(cache_data))
+
+    load_spec_cache()
+
+    assert gi_cleaner.main._persisted_specs == {}
+
+
+def test_spec_cache_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(gi_cleaner.main, "_spec_cache", {})
+    monkeypatch.setattr(gi_cleaner.main, "_persisted_specs", {})
+    project = tmp_path / "project"
+    _write_tree(project, {".gitignore": "*.log\n!keep.log\n", "a.log": "", "keep.log": ""})
+
+    find_ignored_files(project)
+    save_spec_cache(project)
+    gi_cleaner.main._spec_cache.clear()
+    load_spec_cache()
+
+    assert str(project / ".gitignore") in gi_cleaner.main._persisted_specs
+    ignored_files, _ = find_ignored_files(project)
+    assert _relative_paths(ignored_files) == {"a.log"}
+
+
+def test_save_spec_cache_skips_unchanged_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(gi_cleaner.main, "_spec_cache", {})
+    monkeypatch.setattr(gi_cleaner.main, "_persisted_specs", {})
+    project = tmp_path / "project"
+    _write_tree(project, {".gitignore": "*.log\n", "a.log": ""})
+    find_ignored_files(project)
+    save_spec_cache(project)
+    cache_path = get_spec_cache_path()
+    os.utime(cache_path, ns=(0, 0))
+
+    load_spec_cache()
+    save_spec_cache(project)
+
+    assert cache_path.stat().st_mtime_ns == 0
+
+
+def test_save_spec_cache_bounds_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(gi_cleaner.main, "_SPEC_CACHE_MAX_ENTRIES", 2)
+    monkeypatch.setattr(gi_cleaner.main, "_spec_cache", {})
+    monkeypatch.setattr(gi_cleaner.main, "_persisted_specs", {
+        f"/old{index}/.gitignore": ((1, 1), [(True, ["^a$"])]) for index in range(3)
+    })
+    project = tmp_path / "project"
+    _write_tree(project, {".gitignore": "*.log\n"})
+    find_ignored_files(project)
+
+    save_spec_cache(project)
+    gi_cleaner.main._persisted_specs.clear()
+    load_spec_cache()
+
+    assert list(gi_cleaner.main._persisted_specs) == [
+        "/old2/.gitignore", str(project / ".gitignore")
+    ]
+
+
+def test_iter_ignored_items_order_is_stable(tmp_path: Path) -> None:
+    files = {".gitignore": "*.log\nout/\n"}
+    for index in range(30):
+        files[f"d{index}/a.log"] = ""
+        files[f"d{index}/nested/b.log"] = ""
+        files[f"d{index}/out/c.txt"] = ""
+    _write_tree(tmp_path, files)
+
+    runs = [list(iter_ignored_items(tmp_path)) for _ in range(5)]
+
+    assert all(run == runs[0] for run in runs)
+    assert len(runs[0]) == 90
+
+
+def test_iter_ignored_items_close_stops_scan(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = {".gitignore": "*.log\n"}
+    for index in range(8):
+        files[f"d{index}/" + "n/" * 20 + "a.log"] = ""
+    files["d0/a.log"] = ""
+    _write_tree(tmp_path, files)
+    scan_directory = gi_cleaner.main._scan_directory
+
+    def _slow_scan_directory(*args: Any) -> Any:
+        time.sleep(0.02)
+        return scan_directory(*args)
+
+    monkeypatch.setattr(gi_cleaner.main, "_MAX_WORKERS", 4)
+    monkeypatch.setattr(gi_cleaner.main, "_scan_directory", _slow_scan_directory)
+    items = iter_ignored_items(tmp_path)
+    next(items)
+
+    started = time.monotonic()
+    items.close()
+
+    assert time.monotonic() - started < 0.2
+
+
+def test_display_ignored_items_groups_and_sorts(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_tree(tmp_path, {".gitignore": "*.log\nout/\n", "b.log": "", "a.log": "", "out/x": ""})
+
+    ignored_files, ignored_directories = display_ignored_items(iter_ignored_items(tmp_path))
+
+    assert len(ignored_files) == 2 and len(ignored_directories) == 1
+    assert capsys.readouterr().out == (
+        "\nFound 3 ignored item(s):\n\n"
+        "Directories:\n  [DIR]  out/\n"
+        "\nFiles:\n  [FILE] a.log\n  [FILE] b.log\n\n"
+    )
+
+
+def _remaining_paths(root: Path) -> set[str]:
+    return {path.relative_to(root).as_posix() for path in root.rglob("*")}
+
+
+def _item(root: Path, relative_path: str) -> IgnoredItem:
+    return IgnoredItem(str(root / relative_path), relative_path.replace("/", os.sep))
+
+
+@pytest.mark.parametrize("use_dir_fd", [
+    pytest.param(True, marks=pytest.mark.skipif(
+        not gi_cleaner.main._UNLINK_SUPPORTS_DIR_FD, reason="unlinkat() unavailable"
+    )),
+    False,
+])
+def test_unlink_files_removes_only_given_files(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    use_dir_fd: bool
+) -> None:
+    _write_tree(tmp_path, {"sub/a.log": "", "sub/b.log": "", "sub/keep.txt": ""})
+    monkeypatch.setattr(gi_cleaner.main, "_UNLINK_SUPPORTS_DIR_FD", use_dir_fd)
+    unlink = os.unlink
+    dir_fds: list[int | None] = []
+
+    def _recording_unlink(path: str, *, dir_fd: int | None = None) -> None:
+        dir_fds.append(dir_fd)
+        unlink(path, dir_fd=dir_fd)
+
+    monkeypatch.setattr(os, "unlink", _recording_unlink)
+    items = [_item(tmp_path, "sub/a.log"), _item(tmp_path, "sub/missing.log"),
+             _item(tmp_path, "sub/b.log")]
+
+    errors = _unlink_files(str(tmp_path / "sub"), items, dry_run=False)
+
+    assert [error is None for error in errors] == [True, False, True]
+    assert isinstance(errors[1], FileNotFoundError)
+    assert all((dir_fd is not None) == use_dir_fd for dir_fd in dir_fds)
+    assert _remaining_paths(tmp_path) == {"sub", "sub/keep.txt"}
+
+
+def test_unlink_files_dry_run_keeps_files(tmp_path: Path) -> None:
+    _write_tree(tmp_path, {"sub/a.log": ""})
+
+    errors = _unlink_files(str(tmp_path / "sub"), [_item(tmp_path, "sub/a.log")], dry_run=True)
+
+    assert errors == [None]
+    assert _remaining_paths(tmp_path) == {"sub", "sub/a.log"}
+
+
+def test_delete_items_removes_ignored_items(tmp_path: Path) -> None:
+    _write_tree(tmp_path, {
+        ".gitignore": "*.log\nout/\n",
+        "a.log": "",
+        "src/b.log": "",
+        "src/m.py": "",
+        "out/x.o": "",
+        "src/out/y.o": "",
+    })
+    ignored_files, ignored_directories = find_ignored_files(tmp_path)
+
+    assert delete_items(ignored_files, ignored_directories) == (2, 2)
+    assert _remaining_paths(tmp_path) == {".gitignore", "src", "src/m.py"}
+
+
+def test_delete_items_dry_run_keeps_everything(tmp_path: Path) -> None:
+    _write_tree(tmp_path, {".gitignore": "*.log\nout/\n", "a.log": "", "out/x.o": ""})
+    ignored_files, ignored_directories = find_ignored_files(tmp_path)
+
+    assert delete_items(ignored_files, ignored_directories, dry_run=True) == (1, 1)
+    assert _remaining_paths(tmp_path) == {".gitignore", "a.log", "out", "out/x.o"}
+
+
+def test_delete_items_as_found_removes_ignored_items(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str]
+) -> None:
+    files = {".gitignore": "*.log\nout/\n", "keep.txt": ""}
+    for index in range(10):
+        files[f"d{index}/a.log"] = ""
+        files[f"d{index}/b.log"] = ""
+        files[f"d{index}/out/x.o"] = ""
+        files[f"d{index}/m.py"] = ""
+    _write_tree(tmp_path, files)
+    found = [relative_path for _, (_, relative_path) in iter_ignored_items(tmp_path)]
+
+    assert delete_items_as_found(iter_ignored_items(tmp_path)) == (30, 20, 10)
+    assert _remaining_paths(tmp_path) == {".gitignore", "keep.txt"} | {
+        path for index in range(10) for path in (f"d{index}", f"d{index}/m.py")
+    }
+    reported = [
+        line.split(": ", 1)[1].rstrip("/")
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith("Deleted ")
+    ]
+    assert reported == found
+
+
+def test_delete_items_removes_nested_directories_children_first(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_tree(tmp_path, {
+        "a/b/c/x": "", "a/e/y": "", "a/z": "", "d/w": "", "keep/v": "",
+    })
+    ignored_directories = [
+        _item(tmp_path, path) for path in ["a", "a/b", "a/b/c", "a/e", "d"]
+    ]
+
+    assert delete_items([], ignored_directories) == (0, 5)
+    assert _remaining_paths(tmp_path) == {"keep", "keep/v"}
+    output = capsys.readouterr()
+    assert output.err == ""
+    deleted = [
+        line.removeprefix("Deleted directory: ").replace(os.sep, "/")
+        for line in output.out.splitlines()
+    ]
+    for child, parent in [("a/b/c/", "a/b/"), ("a/b/", "a/"), ("a/e/", "a/")]:
+        assert deleted.index(child) < deleted.index(parent)
+
+
+def test_delete_items_leaves_files_inside_ignored_directories_to_them(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_tree(tmp_path, {"a/x.log": "", "a/b/y.log": "", "ab/z.log": "", "keep.txt": ""})
+    ignored_files = [_item(tmp_path, path) for path in ["a/x.log", "a/b/y.log", "ab/z.log"]]
+
+    assert delete_items(ignored_files, [_item(tmp_path, "a")]) == (1, 1)
+    assert _remaining_paths(tmp_path) == {"ab", "keep.txt"}
+    output = capsys.readouterr()
+    assert output.err == ""
+    assert output.out.replace(os.sep, "/") == (
+        "Deleted file: ab/z.log\nDeleted directory: a/\n"
+    )